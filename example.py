@@ -1,7 +1,9 @@
 """Usage example with drone data for calling function directly."""
 
 import logging
+import os
 
+from envidat.s3.bucket import Bucket
 from envidat.utils import get_logger, load_dotenv_if_in_debug_mode
 
 from main import process_cog_list
@@ -28,7 +30,26 @@ dem_tiffs = [
 optical_tiffs = [f"{prefix}{tiff_key}" for tiff_key in optical_tiffs]
 dem_tiffs = [f"{prefix}{tiff_key}" for tiff_key in dem_tiffs]
 
-process_cog_list(optical_tiffs, replicate_from_bucket="envicloud", compress=True)
-process_cog_list(dem_tiffs, replicate_from_bucket="envicloud", is_dem=True)
+# Build the Bucket once and share it across both batches, to avoid
+# paying the bucket creation roundtrip and auth setup twice
+s3_cog = Bucket(os.getenv("BUCKET_NAME", default="cog"), is_new=True, is_public=True)
+
+process_cog_list(
+    optical_tiffs,
+    replicate_from_bucket="envicloud",
+    s3_cog=s3_cog,
+    compress=True,
+    # Explicitly skip the post-write re-scan of each COG, the COG
+    # driver already guarantees a valid structure
+    validate=False,
+)
+process_cog_list(
+    dem_tiffs,
+    replicate_from_bucket="envicloud",
+    s3_cog=s3_cog,
+    is_dem=True,
+    lossless_compression="ZSTD",
+    validate=False,
+)
 
 log.info("Finished main COG generator script.")